@@ -1,100 +1,290 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import argparse
+import collections
+import contextlib
+import copy
+import io
+import multiprocessing
 import os
 import re
+import zipfile
+from xml.sax.saxutils import escape
 
 from docx import Document
+from lxml import etree
 import pandas as pd
+from tqdm import tqdm
 
 CSV_DATA_SEPARATOR = ","
 CSV_FILE = "csv.csv"
 TEMPLATE_FILE = "Forward Template.docx"
 OUTPUT_DIR = "generated_documents"
 
+# CSV columns used by the template, rows are passed around as tuples in this order
+CSV_COLUMNS = ("آدرس گیرنده", "تلفن گیرنده", "کد سفارش", "نام گیرنده")
+ORDER_CODE_FIELD = CSV_COLUMNS.index("کد سفارش")
+CUSTOMER_NAME_FIELD = CSV_COLUMNS.index("نام گیرنده")
+
+# Template placeholders and the CSV column that fills each of them, brackets
+# around placeholders are removed from the template text before matching
+PLACEHOLDER_COLUMNS = {
+    "ستون آدرس گیرنده": "آدرس گیرنده",
+    "ستون تلفن گیرنده": "تلفن گیرنده",
+    "ستون کد سفارش": "کد سفارش",
+    "ستون نام گیرنده": "نام گیرنده",
+}
+PLACEHOLDER_KEYS = tuple(PLACEHOLDER_COLUMNS)
+
+# Position in a row tuple of the value that fills each placeholder
+PLACEHOLDER_FIELDS = {
+    placeholder: CSV_COLUMNS.index(column)
+    for placeholder, column in PLACEHOLDER_COLUMNS.items()
+}
+
+# Matches every known placeholder, captured so splitting text on it keeps them
+PLACEHOLDER_RE = re.compile(
+    "(" + "|".join(re.escape(key) for key in PLACEHOLDER_KEYS) + ")"
+)
+
+# Text of the template nodes holding placeholders is swapped for this marker
+# before serializing, so each row only has to fill the gaps between the chunks
+SLOT_MARKER = "\ue000"
+SLOT_RE = re.compile(
+    rb"<(?:[\w.-]+:)?t(?:\s[^>]*)?>"
+    + re.escape(SLOT_MARKER.encode("utf-8"))
+    + rb"</(?:[\w.-]+:)?t>"
+)
+
+# Characters that python-docx turns into <w:tab/> and <w:br/> in run text
+TAB_OR_BREAK_RE = re.compile(r"(\t|\r\n|\r|\n)")
+
+# Finds any bracketed placeholder, used when analyzing the template structure
+BRACKETED_PLACEHOLDER_RE = re.compile(r"\{[^}]+\}")
+
+# Characters that cannot appear anywhere in an XML 1.0 document
+INVALID_XML_CHARS_RE = re.compile(
+    r"[^\t\n\r\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]"
+)
+
+# Characters not allowed (or not wanted) in filenames, all replaced with "_"
+FILENAME_TRANSLATION = str.maketrans({char: "_" for char in '<>:"/\\|?* '})
+
+# Package parts that can contain placeholders (body, headers and footers)
+TEMPLATE_PART_RE = re.compile(r"word/(document|header\d*|footer\d*)\.xml")
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+NAMESPACES = {"w": W_NAMESPACE}
+RUN_TAG = f"{{{W_NAMESPACE}}}r"
+RUN_PROPERTIES_TAG = f"{{{W_NAMESPACE}}}rPr"
+TEXT_TAG = f"{{{W_NAMESPACE}}}t"
+XML_SPACE_ATTRIBUTE = "{http://www.w3.org/XML/1998/namespace}space"
+
+# Compiled once, collects every text node of a part in a single sweep
+TEXT_NODES_XPATH = etree.XPath(".//w:t", namespaces=NAMESPACES)
+PARAGRAPHS_XPATH = etree.XPath(".//w:p", namespaces=NAMESPACES)
+
+# Rows read from the CSV file at a time, bounds memory use for large inputs
+CSV_CHUNK_SIZE = 1024
+
+# Rows handed to a worker process at a time
+ROWS_PER_CHUNK = 32
+
+# Batches queued per worker process, keeps workers busy while bounding memory
+PENDING_BATCHES_PER_WORKER = 4
+
+# Template shared by every row processed in a worker process
+_template_parts = None
+_static_package = None
+_placeholder_fields = None
+_placeholder_mapping = None
+
 
 def read_csv_file(csv_path):
-    """Read CSV file and return DataFrame"""
-    try:
-        # Read CSV with proper encoding for Persian/Farsi text
-        # Use dtype=str to preserve phone numbers with leading zeros
-        df = pd.read_csv(csv_path, encoding="utf-8", dtype=str, sep=CSV_DATA_SEPARATOR)
-        print(f"Successfully loaded {len(df)} records from CSV")
-        return df
-    except Exception as e:
-        print(f"Error reading CSV file: {e}")
-        return None
+    """Open CSV file and return a reader yielding DataFrame chunks"""
+    # Read CSV with proper encoding for Persian/Farsi text
+    # Use dtype=str to preserve phone numbers with leading zeros
+    return pd.read_csv(
+        csv_path,
+        encoding="utf-8",
+        dtype=str,
+        sep=CSV_DATA_SEPARATOR,
+        chunksize=CSV_CHUNK_SIZE,
+    )
 
 
 def read_template_docx(template_path):
-    """Read the template DOCX file"""
-    try:
-        doc = Document(template_path)
-        print("Template DOCX file loaded successfully")
-        return doc
-    except Exception as e:
-        print(f"Error reading template DOCX file: {e}")
-        return None
-
-
-def replace_text_in_paragraph(paragraph, replacements):
-    """Replace text in a paragraph while preserving formatting"""
-    for run in paragraph.runs:
-        for placeholder, replacement in replacements.items():
-            if placeholder in run.text:
-                run.text = run.text.replace(placeholder, replacement).strip("{}")
-            if "{" in run.text or "}" in run.text:
-                # If there are still brackets, remove them
-                run.text = run.text.replace("{", "").replace("}", "")
-
-
-def replace_text_in_table(table, replacements):
-    """Replace text in table cells while preserving structure"""
-    for row in table.rows:
-        for cell in row.cells:
-            for paragraph in cell.paragraphs:
-                replace_text_in_paragraph(paragraph, replacements)
-
-
-def find_and_replace_in_document(doc, replacements):
-    """Find and replace text throughout the document"""
-    # Replace in regular paragraphs
-    for paragraph in doc.paragraphs:
-        replace_text_in_paragraph(paragraph, replacements)
-
-    # Replace in tables
-    for table in doc.tables:
-        replace_text_in_table(table, replacements)
+    """Read the template DOCX file and return its bytes with the parsed parts"""
+    with open(template_path, "rb") as f:
+        template_bytes = f.read()
+
+    # The parts are parsed once here and handed to every worker, a full
+    # python-docx Document is only built when analyzing
+    template_parts = read_template_parts(template_bytes)
+    if "word/document.xml" not in template_parts:
+        raise ValueError("word/document.xml not found in the package")
+    return template_bytes, template_parts
+
+
+def read_template_parts(template_bytes):
+    """Read the template XML parts that can hold placeholders, ready for replacing
+
+    Each part is parsed once to merge split runs and remove brackets, then kept
+    serialized as (info, chunks, slots): the text nodes holding placeholders
+    are cut out as slots of (prefix, text pieces), so rows only need to render
+    those nodes and join them with the static chunks around them.
+    """
+    template_parts = {}
+    with zipfile.ZipFile(io.BytesIO(template_bytes)) as template_zip:
+        for info in template_zip.infolist():
+            if not TEMPLATE_PART_RE.fullmatch(info.filename):
+                continue
+            root = etree.fromstring(template_zip.read(info))
+            merge_adjacent_runs(root)
+            remove_brackets(root)
+
+            slots = []
+            for text_node in TEXT_NODES_XPATH(root):
+                if text_node.text and PLACEHOLDER_RE.search(text_node.text):
+                    pieces = tuple(PLACEHOLDER_RE.split(text_node.text))
+                    slots.append((text_node.prefix, pieces))
+                    text_node.text = SLOT_MARKER
+
+            serialized = etree.tostring(root, encoding="UTF-8", standalone=True)
+            chunks = tuple(SLOT_RE.split(serialized))
+            if len(chunks) != len(slots) + 1:
+                raise ValueError(f"{info.filename} contains reserved text")
+            template_parts[info.filename] = (info, chunks, tuple(slots))
+    return template_parts
+
+
+def is_text_run(element):
+    """Check if an element is a run holding nothing but formatting and text"""
+    if element.tag != RUN_TAG:
+        return False
+    tags = [child.tag for child in element]
+    return TEXT_TAG in tags and all(
+        tag in (RUN_PROPERTIES_TAG, TEXT_TAG) for tag in tags
+    )
 
 
-def create_docx_from_template(template_doc, row_data, output_path):
+def run_formatting(run):
+    """Return the serialized formatting of a run, used to compare runs"""
+    properties = run.find(RUN_PROPERTIES_TAG)
+    return b"" if properties is None else etree.tostring(properties)
+
+
+def merge_adjacent_runs(root):
+    """Merge neighbouring text runs with identical formatting into one run
+
+    Word often splits a placeholder over several runs with the same
+    formatting, merging them lets the whole placeholder be replaced at once.
+    """
+    for paragraph in PARAGRAPHS_XPATH(root):
+        previous = None
+        for element in list(paragraph):
+            if not is_text_run(element):
+                previous = None
+                continue
+            if previous is None or run_formatting(previous) != run_formatting(element):
+                previous = element
+                continue
+
+            # Move the text into the last text node of the previous run
+            text_node = previous.findall(TEXT_TAG)[-1]
+            text_node.text = (text_node.text or "") + "".join(
+                node.text or "" for node in element.iterfind(TEXT_TAG)
+            )
+            text_node.set(XML_SPACE_ATTRIBUTE, "preserve")
+            paragraph.remove(element)
+
+
+def build_static_package(template_bytes, template_parts):
+    """Compress every template entry that is never modified into a zip, once"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(template_bytes)) as template_zip:
+        with zipfile.ZipFile(buffer, "w") as static_zip:
+            for info in template_zip.infolist():
+                if info.filename not in template_parts:
+                    static_zip.writestr(info, template_zip.read(info))
+    return buffer.getvalue()
+
+
+def remove_brackets(root):
+    """Remove brackets from every text node of an XML part"""
+    for text_node in TEXT_NODES_XPATH(root):
+        text = text_node.text
+        if text and ("{" in text or "}" in text):
+            text_node.text = text.replace("{", "").replace("}", "")
+
+
+def find_template_placeholders(template_parts):
+    """Return the known placeholders that actually occur in the template parts"""
+    found = set()
+    for _, _, slots in template_parts.values():
+        for _, pieces in slots:
+            # Placeholders sit at the odd positions of the split text
+            found.update(pieces[1::2])
+    return tuple(key for key in PLACEHOLDER_KEYS if key in found)
+
+
+def encode_xml_text(text, prefix):
+    """Encode text as the XML content of a run, like python-docx's run.text setter
+
+    Tabs and line breaks become <w:tab/> and <w:br/> elements, and text nodes
+    with leading or trailing whitespace get xml:space="preserve".
+    """
+    invalid_char = INVALID_XML_CHARS_RE.search(text)
+    if invalid_char:
+        raise ValueError(
+            f"Text {text!r} contains a character not allowed in XML: "
+            f"{invalid_char.group(0)!r}"
+        )
+
+    tag_prefix = f"{prefix}:" if prefix else ""
+    content = []
+    for piece in TAB_OR_BREAK_RE.split(text):
+        if piece == "\t":
+            content.append(f"<{tag_prefix}tab/>")
+        elif piece in ("\r\n", "\r", "\n"):
+            content.append(f"<{tag_prefix}br/>")
+        elif piece:
+            space = ' xml:space="preserve"' if piece != piece.strip() else ""
+            piece = escape(piece, {'"': "&quot;"})
+            content.append(f"<{tag_prefix}t{space}>{piece}</{tag_prefix}t>")
+    return "".join(content).encode("utf-8")
+
+
+def render_part(chunks, slots, mapping):
+    """Render an XML part by filling its placeholder slots with row values"""
+    content = [chunks[0]]
+    for (prefix, pieces), chunk in zip(slots, chunks[1:]):
+        text = "".join(
+            mapping[piece] if position % 2 else piece
+            for position, piece in enumerate(pieces)
+        )
+        content.append(encode_xml_text(text, prefix))
+        content.append(chunk)
+    return b"".join(content)
+
+
+def render_docx(static_package, template_parts, mapping):
+    """Render a DOCX document in memory and return the buffer holding it"""
+    # Start from the already compressed static entries and only add the
+    # parts that hold placeholders, so nothing else is compressed again
+    buffer = io.BytesIO(static_package)
+    with zipfile.ZipFile(buffer, "a") as output_zip:
+        for info, chunks, slots in template_parts.values():
+            output_zip.writestr(copy.copy(info), render_part(chunks, slots, mapping))
+    return buffer
+
+
+def create_docx_from_template(static_package, template_parts, mapping, output_path):
     """Create a DOCX file from template and row data while preserving structure"""
     try:
-        # Create a copy of the template document
-        # We need to save and reload to create a proper copy
-        temp_path = "temp_template.docx"
-        template_doc.save(temp_path)
-        new_doc = Document(temp_path)
-
-        # Clean up temporary file
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
-
-        # Define replacements based on CSV columns and template placeholders
-        replacements = {
-            "{ستون آدرس گیرنده}": str(row_data.get("آدرس گیرنده", "")),
-            "{ستون تلفن گیرنده}": str(row_data.get("تلفن گیرنده", "")),
-            "{ستون کد سفارش}": str(row_data.get("کد سفارش", "")),
-            "{ستون نام گیرنده}": str(row_data.get("نام گیرنده", "")),
-            # Also handle without brackets if they exist
-            "ستون آدرس گیرنده": str(row_data.get("آدرس گیرنده", "")),
-            "ستون تلفن گیرنده": str(row_data.get("تلفن گیرنده", "")),
-            "ستون کد سفارش": str(row_data.get("کد سفارش", "")),
-            "ستون نام گیرنده": str(row_data.get("نام گیرنده", "")),
-        }
-
-        # Find and replace text in the document
-        find_and_replace_in_document(new_doc, replacements)
-
-        # Save the new document
-        new_doc.save(output_path)
+        buffer = render_docx(static_package, template_parts, mapping)
+
+        # Save the new document with a single write straight from the buffer
+        with open(output_path, "wb") as f:
+            f.write(buffer.getbuffer())
         return True
 
     except Exception as e:
@@ -102,20 +292,127 @@ def create_docx_from_template(template_doc, row_data, output_path):
         return False
 
 
-def generate_filename(row_data, index):
+def generate_filename(row_values, index):
     """Generate filename based on row data"""
     # Use order code and customer name for filename
-    order_code = str(row_data.get("کد سفارش", f"order_{index}")).replace("/", "_")
-    customer_name = str(row_data.get("نام گیرنده", f"customer_{index}")).replace(
-        " ", "_"
-    )
+    order_code = row_values[ORDER_CODE_FIELD] or f"order_{index}"
+    customer_name = row_values[CUSTOMER_NAME_FIELD] or f"customer_{index}"
+
+    # Clean filename from invalid characters and spaces in a single pass
+    return f"{order_code}_{customer_name}.docx".translate(FILENAME_TRANSLATION)
+
+
+def unique_archive_name(filename, index, archive_names):
+    """Return a name not yet used in the archive and record it as used"""
+    # Rows sharing an order code and customer name would otherwise be
+    # written under the same name, the row index tells them apart
+    stem, extension = os.path.splitext(filename)
+    candidate = filename
+    attempt = 0
+    while candidate in archive_names:
+        attempt += 1
+        suffix = f"_{index}" if attempt == 1 else f"_{index}_{attempt}"
+        candidate = f"{stem}{suffix}{extension}"
+    archive_names.add(candidate)
+    return candidate
+
+
+def _init_worker(static_package, template_parts):
+    """Store the prepared template in the worker process"""
+    global _template_parts, _static_package, _placeholder_fields, _placeholder_mapping
+    _template_parts = template_parts
+    _static_package = static_package
+
+    # Only fill the placeholders this template uses
+    keys = find_template_placeholders(_template_parts)
+    _placeholder_fields = tuple((key, PLACEHOLDER_FIELDS[key]) for key in keys)
+    _placeholder_mapping = dict.fromkeys(keys, "")
+
+
+def _process_row(args):
+    """Generate the DOCX file for a single CSV row inside a worker process
+
+    Without an output directory the file is not written, its row index, name
+    and bytes are returned instead so the caller can add them to an archive.
+    """
+    index, row_values, output_directory = args
+    try:
+        # Generate filename
+        filename = generate_filename(row_values, index)
+
+        # Map each template placeholder to its value from the CSV row, reusing
+        # the worker's mapping since only the values change between rows
+        for key, field in _placeholder_fields:
+            # Brackets are removed from inserted values too, like from the template
+            value = row_values[field]
+            _placeholder_mapping[key] = value.replace("{", "").replace("}", "")
+
+        if output_directory is None:
+            buffer = render_docx(_static_package, _template_parts, _placeholder_mapping)
+            document = (index, filename, buffer.getvalue())
+            return True, f"✓ Created: {filename}", document
+
+        # Create DOCX file from template
+        output_path = os.path.join(output_directory, filename)
+        if create_docx_from_template(
+            _static_package,
+            _template_parts,
+            _placeholder_mapping,
+            output_path,
+        ):
+            return True, f"✓ Created: {filename}", None
+        return False, f"✗ Failed: {filename}", None
+
+    except Exception as e:
+        return False, f"✗ Error processing row {index}: {e}", None
 
-    # Clean filename from invalid characters
-    filename = f"{order_code}_{customer_name}.docx"
-    # Remove invalid characters for filename
-    filename = re.sub(r'[<>:"/\\|?*]', "_", filename)
 
-    return filename
+def _process_rows(tasks):
+    """Generate the DOCX files for a batch of CSV rows inside a worker process"""
+    return [_process_row(task) for task in tasks]
+
+
+def iter_task_batches(reader, output_directory, max_workers, read_errors):
+    """Yield batches of row tasks from the CSV chunks
+
+    Reading stops at the first malformed chunk and the error is appended to
+    read_errors. Only the chunks read before it are processed, the rows of
+    the failing chunk and everything after it are skipped.
+    """
+    row_count = 0
+    try:
+        for chunk in reader:
+            # Convert the template columns to strings once per chunk,
+            # missing values become empty
+            rows = chunk.reindex(columns=list(CSV_COLUMNS)).fillna("").astype(str)
+            tasks = [
+                (index, row_values, output_directory)
+                for index, row_values in enumerate(
+                    rows.itertuples(index=False, name=None), start=row_count + 1
+                )
+            ]
+            row_count += len(tasks)
+            batch_size = max(1, min(ROWS_PER_CHUNK, len(tasks) // (max_workers * 4)))
+            for start in range(0, len(tasks), batch_size):
+                yield tasks[start : start + batch_size]
+    except (pd.errors.ParserError, UnicodeDecodeError) as e:
+        tqdm.write(f"Error reading CSV file: {e}")
+        read_errors.append(e)
+
+
+def process_task_batches(executor, batches, max_pending):
+    """Run batches of row tasks on the pool and yield their results in order
+
+    At most max_pending batches are queued at once, so rows keep streaming from
+    the CSV without the pool draining between chunks.
+    """
+    pending = collections.deque()
+    for batch in batches:
+        pending.append(executor.submit(_process_rows, batch))
+        if len(pending) >= max_pending:
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
 
 
 def analyze_template_structure(template_doc):
@@ -146,7 +443,7 @@ def analyze_template_structure(template_doc):
     for paragraph in template_doc.paragraphs:
         if "{" in paragraph.text and "}" in paragraph.text:
             # Extract placeholders
-            found_placeholders = re.findall(r"\{[^}]+\}", paragraph.text)
+            found_placeholders = BRACKETED_PLACEHOLDER_RE.findall(paragraph.text)
             placeholders.update(found_placeholders)
 
     # Check tables
@@ -154,7 +451,7 @@ def analyze_template_structure(template_doc):
         for row in table.rows:
             for cell in row.cells:
                 if "{" in cell.text and "}" in cell.text:
-                    found_placeholders = re.findall(r"\{[^}]+\}", cell.text)
+                    found_placeholders = BRACKETED_PLACEHOLDER_RE.findall(cell.text)
                     placeholders.update(found_placeholders)
 
     if placeholders:
@@ -167,65 +464,118 @@ def analyze_template_structure(template_doc):
     print("=" * 50)
 
 
-def main():
-    """Main function to process CSV and generate DOCX files"""
+def main(analyze=False, archive=False):
+    """Main function to process CSV and generate DOCX files
+
+    Returns False when the inputs could not be read completely.
+    """
 
     # Configuration
     csv_file_path = CSV_FILE  # Your CSV file path
     template_file_path = TEMPLATE_FILE  # Your template DOCX file path
     output_directory = OUTPUT_DIR  # Output directory for DOCX files
+    archive_path = f"{OUTPUT_DIR}.zip"  # Output archive when archive is set
 
     # Create output directory if it doesn't exist
-    if not os.path.exists(output_directory):
-        os.makedirs(output_directory)
-        print(f"Created output directory: {output_directory}")
+    if not archive:
+        os.makedirs(output_directory, exist_ok=True)
 
-    # Read template document
-    template_doc = read_template_docx(template_file_path)
-    if template_doc is None:
+    # Read template bytes and open CSV data at the same time, they are
+    # independent and both spend most of their time in I/O and C code
+    with ThreadPoolExecutor(max_workers=2) as loader:
+        template_future = loader.submit(read_template_docx, template_file_path)
+        reader_future = loader.submit(read_csv_file, csv_file_path)
+
+    # Report the status here so the two loader threads never interleave output
+    try:
+        template_bytes, template_parts = template_future.result()
+        print("Template DOCX file loaded successfully")
+    except Exception as e:
+        print(f"Error reading template DOCX file: {e}")
+        template_bytes = None
+
+    try:
+        reader = reader_future.result()
+        print("Successfully opened CSV file")
+    except Exception as e:
+        print(f"Error reading CSV file: {e}")
+        reader = None
+
+    if template_bytes is None:
         print(f"Error: Could not read template file '{template_file_path}'")
         print("Make sure the file exists and is a valid DOCX file.")
-        return
+        if reader is not None:
+            reader.close()
+        return False
 
-    # Analyze template structure
-    analyze_template_structure(template_doc)
+    if reader is None:
+        return False
+
+    # Analyze template structure (only on request, it is for diagnostics only)
+    if analyze:
+        analyze_template_structure(Document(io.BytesIO(template_bytes)))
 
-    # Read CSV data
-    df = read_csv_file(csv_file_path)
-    if df is None:
-        return
+    print("\nProcessing records...")
 
-    print(f"\nProcessing {len(df)} records...")
+    # Compress the static entries once, the workers only receive the result
+    static_package = build_static_package(template_bytes, template_parts)
 
-    # Process each row
+    # Process rows in parallel, each worker stores the prepared template once
     successful_count = 0
     failed_count = 0
+    archive_names = set()
+    read_errors = []
+    max_workers = os.cpu_count() or 1
+
+    # Documents are already compressed, so the archive only stores them
+    output_archive = (
+        zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_STORED)
+        if archive
+        else contextlib.nullcontext()
+    )
 
-    for index, row in df.iterrows():
-        try:
-            # Generate filename
-            filename = generate_filename(row, index + 1)
-            output_path = os.path.join(output_directory, filename)
-
-            # Create DOCX file from template
-            if create_docx_from_template(template_doc, row, output_path):
+    with reader, output_archive, ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(static_package, template_parts),
+    ) as executor, tqdm(desc="Generating", unit=" files") as progress:
+        batches = iter_task_batches(
+            reader, None if archive else output_directory, max_workers, read_errors
+        )
+        for success, message, document in process_task_batches(
+            executor, batches, max_workers * PENDING_BATCHES_PER_WORKER
+        ):
+            if document is not None:
+                index, filename, data = document
+                filename = unique_archive_name(filename, index, archive_names)
+                output_archive.writestr(filename, data)
+
+            # Only failures are reported individually, above the progress bar
+            if success:
                 successful_count += 1
-                print(f"✓ Created: {filename}")
             else:
                 failed_count += 1
-                print(f"✗ Failed: {filename}")
-
-        except Exception as e:
-            failed_count += 1
-            print(f"✗ Error processing row {index + 1}: {e}")
+                progress.write(message)
+            progress.update()
 
     # Print summary
     print(f"\n=== Processing Summary ===")
-    print(f"Total records: {len(df)}")
+    print(f"Total records: {successful_count + failed_count}")
     print(f"Successfully processed: {successful_count}")
     print(f"Failed: {failed_count}")
-    print(f"Output directory: {output_directory}")
+    if archive:
+        print(f"Output archive: {archive_path}")
+    else:
+        print(f"Output directory: {output_directory}")
+
+    # A CSV that could not be read to the end leaves the output incomplete
+    if read_errors:
+        print("Processing aborted: the CSV file could not be read completely,")
+        print("rows from the malformed part onward were not processed.")
+        return False
+
     print(f"Files ready for use!")
+    return True
 
 
 def check_files_exist():
@@ -248,8 +598,27 @@ def check_files_exist():
 
 
 if __name__ == "__main__":
+    # Required for worker processes in frozen (pyinstaller) executables
+    multiprocessing.freeze_support()
+
+    parser = argparse.ArgumentParser(
+        description="Generate DOCX files from CSV data and a template"
+    )
+    parser.add_argument(
+        "--analyze",
+        action="store_true",
+        help="print the template structure and placeholders before processing",
+    )
+    parser.add_argument(
+        "--archive",
+        action="store_true",
+        help="write all documents into a single zip archive instead of a directory",
+    )
+    args = parser.parse_args()
+
     # Check if files exist
     if not check_files_exist():
         exit(1)
 
-    main()
+    if not main(analyze=args.analyze, archive=args.archive):
+        exit(1)